@@ -10,6 +10,9 @@ from .nodes.variable_node import NODE_DISPLAY_NAME_MAPPINGS as VARIABLE_NODE_DIS
 from .nodes.weighted_attributes_formatter_node import NODE_CLASS_MAPPINGS as WEIGHTED_ATTRIBUTES_FORMATTER_NODE_CLASS_MAPPINGS
 from .nodes.weighted_attributes_formatter_node import NODE_DISPLAY_NAME_MAPPINGS as WEIGHTED_ATTRIBUTES_FORMATTER_NODE_DISPLAY_NAME_MAPPINGS
 
+from .nodes.prompt_assembly_node import NODE_CLASS_MAPPINGS as PROMPT_ASSEMBLY_NODE_CLASS_MAPPINGS
+from .nodes.prompt_assembly_node import NODE_DISPLAY_NAME_MAPPINGS as PROMPT_ASSEMBLY_NODE_DISPLAY_NAME_MAPPINGS
+
 from .nodes.lora_trigger_loader import NODE_CLASS_MAPPINGS as LORA_TRIGGER_LOADER_NODE_CLASS_MAPPINGS
 from .nodes.lora_trigger_loader import NODE_DISPLAY_NAME_MAPPINGS as LORA_TRIGGER_LOADER_NODE_DISPLAY_NAME_MAPPINGS
 
@@ -17,6 +20,7 @@ from .nodes.lora_trigger_loader import NODE_DISPLAY_NAME_MAPPINGS as LORA_TRIGGE
 NODE_CLASS_MAPPINGS = {
     **LORA_TRIGGER_LOADER_NODE_CLASS_MAPPINGS,
     **MULTICLIP_PROMPT_COMBINATOR_NODE_CLASS_MAPPINGS,
+    **PROMPT_ASSEMBLY_NODE_CLASS_MAPPINGS,
     **TEMPLATE_NODE_CLASS_MAPPINGS,
     **VARIABLE_NODE_CLASS_MAPPINGS,
     **WEIGHTED_ATTRIBUTES_FORMATTER_NODE_CLASS_MAPPINGS
@@ -25,6 +29,7 @@ NODE_CLASS_MAPPINGS = {
 NODE_DISPLAY_NAME_MAPPINGS = {
     **LORA_TRIGGER_LOADER_NODE_DISPLAY_NAME_MAPPINGS,
     **MULTICLIP_PROMPT_COMBINATOR_NODE_DISPLAY_NAME_MAPPINGS,
+    **PROMPT_ASSEMBLY_NODE_DISPLAY_NAME_MAPPINGS,
     **TEMPLATE_NODE_DISPLAY_NAME_MAPPINGS,
     **VARIABLE_NODE_DISPLAY_NAME_MAPPINGS,
     **WEIGHTED_ATTRIBUTES_FORMATTER_NODE_DISPLAY_NAME_MAPPINGS
@@ -0,0 +1,280 @@
+"""
+Headless batch prompt generator.
+
+Renders prompts from a JSONL job file with the same logic as the Prompt Assembly,
+Variable, Template Interpolation, Weighted Attributes Formatter and LoRA trigger word
+nodes, across a process pool, without ComfyUI being installed.
+
+Each job line is a JSON object:
+
+    {
+        "id": "optional id, defaults to the line number",
+        "spec": {... Prompt Assembly spec, optional if --spec is given ...},
+        "variables": {"PLANET": "VENUS"},
+        "trigger_words": "extra, trigger words",
+        "loras": [{"name": "style.safetensors", "top_percent": 20, "ranking": "frequency"}]
+    }
+
+"ranking" accepts the same values as the LoRA loader node: "frequency" (default) or
+"distinctive (tf-idf)". Distinctive ranking uses the tag statistics of --lora-dir,
+which are only rebuilt when --refresh-statistics is given.
+
+Results are written as JSONL in input order, one {"id", "prompt"} or {"id", "error"}
+object per job.
+
+Usage (from the repository root):
+
+    python -m nodes.batch_prompt_cli jobs.jsonl -o prompts.jsonl --lora-dir /path/to/loras
+"""
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from .lora_trigger_loader import (
+    DISTINCTIVE_RANKING,
+    FREQUENCY_RANKING,
+    TRIGGER_WORD_RANKINGS,
+    LoraTagStatistics,
+    LoraTriggerExtractor,
+    get_tag_statistics_file,
+)
+from .prompt_assembly_node import compile_prompt_plan
+
+# Worker process state, set by _init_worker
+_base_spec = None
+_lora_dir = None
+_statistics_file = None
+_tag_statistics = None
+
+
+def _init_worker(base_spec, lora_dir, statistics_file):
+    """Set up a worker process and silence the prints of the node logic."""
+    global _base_spec, _lora_dir, _statistics_file
+    _base_spec = base_spec
+    _lora_dir = lora_dir
+    _statistics_file = statistics_file
+    sys.stdout = open(os.devnull, "w")
+
+
+def _get_tag_statistics():
+    """Load the persisted tag statistics once per worker, without refreshing them."""
+    global _tag_statistics
+    if _tag_statistics is None:
+        _tag_statistics = LoraTagStatistics(_lora_dir, _statistics_file)
+    return _tag_statistics
+
+
+@lru_cache(maxsize=1024)
+def _get_lora_triggers(lora_name, top_percent, ranking):
+    """Extract the trigger word string of a LoRA, cached per worker."""
+    if ranking not in TRIGGER_WORD_RANKINGS:
+        raise ValueError(f"Unknown trigger word ranking '{ranking}', expected one of {TRIGGER_WORD_RANKINGS}")
+
+    # The extractor reports unreadable files by returning no trigger words, so check
+    # the file up front to fail the job instead of rendering a prompt without them
+    lora_file_path = lora_name if _lora_dir is None else os.path.join(_lora_dir, lora_name)
+    if not os.path.isfile(lora_file_path) or not os.access(lora_file_path, os.R_OK):
+        raise ValueError(f"LoRA file not found or not readable: {lora_file_path}")
+
+    extractor = LoraTriggerExtractor()
+    if ranking == DISTINCTIVE_RANKING:
+        if _lora_dir is None:
+            raise ValueError("Distinctive trigger word ranking requires --lora-dir")
+        statistics = _get_tag_statistics()
+        if lora_name not in statistics.files:
+            raise ValueError(f"LoRA '{lora_name}' is not in the tag statistics, run with --refresh-statistics")
+        trigger_words = extractor.get_top_percent_distinctive_triggers(
+            lora_name,
+            statistics,
+            top_percent=top_percent
+        )
+    else:
+        trigger_words = extractor.get_top_percent_triggers(lora_file_path, top_percent=top_percent)
+    return ", ".join(trigger_words)
+
+
+def render_job(job):
+    """
+    Render the prompt of a single job.
+
+    Args:
+        job: Job dict as described in the module docstring
+
+    Returns:
+        The assembled prompt string
+    """
+    spec = job.get("spec", _base_spec)
+    if spec is None:
+        raise ValueError("Job has no spec and no --spec was given")
+    spec_text = spec if isinstance(spec, str) else json.dumps(spec, sort_keys=True)
+
+    trigger_sources = []
+    for lora in job.get("loras", []):
+        trigger_sources.append(_get_lora_triggers(
+            lora["name"],
+            int(lora.get("top_percent", 20)),
+            lora.get("ranking", FREQUENCY_RANKING)
+        ))
+    if job.get("trigger_words"):
+        trigger_sources.append(job["trigger_words"])
+    trigger_words = ", ".join(source for source in trigger_sources if source)
+
+    overrides = job.get("variables") or None
+    override_names = tuple(sorted(overrides)) if overrides else ()
+
+    plan = compile_prompt_plan(spec_text, override_names)
+    return plan.render(trigger_words, overrides)
+
+
+def render_chunk(lines):
+    """
+    Render a chunk of job lines.
+
+    Args:
+        lines: List of (line_number, line) tuples
+
+    Returns:
+        Tuple of (list of JSON encoded result lines in the same order, number of failed jobs)
+    """
+    results = []
+    num_errors = 0
+    for line_number, line in lines:
+        job_id = line_number
+        try:
+            job = json.loads(line)
+            job_id = job.get("id", line_number)
+            result = {"id": job_id, "prompt": render_job(job)}
+        except Exception as e:
+            result = {"id": job_id, "error": str(e)}
+            num_errors += 1
+        results.append(json.dumps(result, ensure_ascii=False))
+    return results, num_errors
+
+
+def _read_chunks(input_file, chunk_size):
+    """Yield lists of (line_number, line) tuples of non-empty job lines."""
+    chunk = []
+    for line_number, line in enumerate(input_file, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        chunk.append((line_number, line))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def generate_prompts(input_file, output_file, base_spec=None, lora_dir=None,
+                     statistics_file=None, workers=None, chunk_size=256):
+    """
+    Render all jobs of a JSONL input file to a JSONL output file, in input order.
+
+    At most a few chunks per worker are in flight at any time, so memory stays bounded
+    regardless of the number of jobs.
+
+    Returns:
+        Tuple of (number of jobs, number of failed jobs)
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 4
+    num_jobs = 0
+    num_errors = 0
+
+    def write_results(chunk_result):
+        nonlocal num_jobs, num_errors
+        results, chunk_errors = chunk_result
+        num_jobs += len(results)
+        num_errors += chunk_errors
+        for result in results:
+            output_file.write(result + "\n")
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(base_spec, lora_dir, statistics_file)
+    ) as executor:
+        pending = deque()
+        for chunk in _read_chunks(input_file, chunk_size):
+            pending.append(executor.submit(render_chunk, chunk))
+            if len(pending) >= max_pending:
+                write_results(pending.popleft().result())
+        while pending:
+            write_results(pending.popleft().result())
+
+    return num_jobs, num_errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m nodes.batch_prompt_cli",
+        description="Render prompts from a JSONL job file using the LLMCoder2023 node logic."
+    )
+    parser.add_argument("jobs", help="JSONL job file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file, or - for stdout (default)")
+    parser.add_argument("--spec", help="JSON Prompt Assembly spec file used by jobs without a spec")
+    parser.add_argument("--lora-dir", help="Directory LoRA names in jobs are relative to")
+    parser.add_argument("--statistics-file",
+                        help="LoRA tag statistics file used for distinctive ranking (default: per library, "
+                             "separate from the one used inside ComfyUI)")
+    parser.add_argument("--refresh-statistics", action="store_true",
+                        help="Bring the LoRA tag statistics up to date before rendering")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Jobs per worker task (default: 256)")
+    args = parser.parse_args(argv)
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    if args.refresh_statistics and not args.lora_dir:
+        parser.error("--refresh-statistics requires --lora-dir")
+
+    base_spec = None
+    if args.spec:
+        with open(args.spec, "r", encoding="utf-8") as f:
+            base_spec = json.dumps(json.load(f), sort_keys=True)
+
+    statistics_file = args.statistics_file
+    if args.lora_dir and not statistics_file:
+        statistics_file = os.path.splitext(get_tag_statistics_file(args.lora_dir))[0] + ".cli.json"
+
+    # Bring the tag statistics up to date once if asked to, the workers only read them
+    if args.refresh_statistics:
+        statistics = LoraTagStatistics(args.lora_dir, statistics_file)
+        stdout = sys.stdout
+        sys.stdout = sys.stderr
+        try:
+            statistics.refresh()
+        finally:
+            sys.stdout = stdout
+
+    input_file = sys.stdin if args.jobs == "-" else open(args.jobs, "r", encoding="utf-8")
+    output_file = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        num_jobs, num_errors = generate_prompts(
+            input_file,
+            output_file,
+            base_spec=base_spec,
+            lora_dir=args.lora_dir,
+            statistics_file=statistics_file,
+            workers=args.workers,
+            chunk_size=args.chunk_size
+        )
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    print(f"Rendered {num_jobs} prompts ({num_errors} failed)", file=sys.stderr)
+    return 1 if num_errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,28 @@
 import os
 import json
+import hashlib
+import math
 import struct
-import folder_paths
 from collections import OrderedDict
 
-# Get the path to the LoRA models
-lora_path = folder_paths.get_folder_paths("loras")[0]
+def get_lora_path():
+    """Get the path to the LoRA models."""
+    # Imported here so the extraction logic can be used outside of ComfyUI
+    import folder_paths
+    return folder_paths.get_folder_paths("loras")[0]
+
+# Trigger word ranking modes, shared by the loader node and the batch CLI
+FREQUENCY_RANKING = "frequency"
+DISTINCTIVE_RANKING = "distinctive (tf-idf)"
+TRIGGER_WORD_RANKINGS = [FREQUENCY_RANKING, DISTINCTIVE_RANKING]
+
+# Where the library-wide tag statistics are persisted between runs, one file per library
+tag_statistics_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "lora_tag_statistics")
+
+def get_tag_statistics_file(lora_dir):
+    """Get the statistics file of a LoRA library directory."""
+    lora_dir_hash = hashlib.sha1(os.path.realpath(lora_dir).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(tag_statistics_dir, f"{lora_dir_hash}.json")
 
 class LoraTriggerExtractor:
     def __init__(self):
@@ -80,12 +97,234 @@ class LoraTriggerExtractor:
         # Return the top N tags
         return list(sorted_tags.keys())[:num_items]
 
+    def get_top_percent_distinctive_triggers(self, lora_name, statistics, top_percent=20):
+        """
+        Get the top percentage of trigger words from a LoRA file, ranked by their
+        frequency weighted with the inverse document frequency across the library.
+        
+        Args:
+            lora_name: File name of the LoRA inside the statistics library directory
+            statistics: LoraTagStatistics of the LoRA library
+            top_percent: Percentage of top trigger words to return (default: 20)
+            
+        Returns:
+            List of top percentage of trigger words, or empty list if extraction failed
+        """
+        ranked_tags = statistics.get_ranked_tags(lora_name)
+        if not ranked_tags:
+            return []
+            
+        # Calculate how many items to include
+        num_items = max(1, int(len(ranked_tags) * (top_percent / 100.0)))
+        
+        # Return the top N tags
+        return ranked_tags[:num_items]
+
+
+class LoraTagStatistics:
+    """
+    Library-wide tag statistics used to rank trigger words by TF-IDF.
+    
+    Stores the tag frequencies of every LoRA file together with the number of files
+    each tag appears in (document frequency). The statistics are persisted to disk and
+    only files that were added, changed or removed since the last run are re-read.
+    """
+    
+    def __init__(self, lora_dir, statistics_file=None):
+        self.lora_dir = os.path.realpath(lora_dir)
+        self.statistics_file = statistics_file or get_tag_statistics_file(self.lora_dir)
+        # File name -> {"mtime": float, "size": int, "tags": {tag: count}}
+        self.files = {}
+        # Tag -> number of files containing the tag
+        self.document_frequency = {}
+        # Number of files with tag frequency data, the document count of the IDF
+        self.num_tagged_files = 0
+        # File name -> tags sorted by TF-IDF score, cleared whenever the library changes
+        self._ranked_tags = {}
+        self.load()
+    
+    def load(self):
+        """Load persisted statistics, starting empty if they are missing or for another library."""
+        try:
+            with open(self.statistics_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if data.get("lora_dir") != self.lora_dir:
+            return
+        
+        self.files = data.get("files", {})
+        self.document_frequency = data.get("document_frequency", {})
+        self.num_tagged_files = sum(1 for entry in self.files.values() if entry["tags"])
+    
+    def save(self):
+        """Persist the statistics, replacing the previous file atomically."""
+        data = {
+            "lora_dir": self.lora_dir,
+            "files": self.files,
+            "document_frequency": self.document_frequency,
+        }
+        tmp_path = self.statistics_file + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.statistics_file), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.statistics_file)
+        except OSError as e:
+            print(f"Error saving LoRA tag statistics to {self.statistics_file}: {str(e)}")
+    
+    def update_file(self, lora_name):
+        """
+        Update the statistics for a single LoRA file if it was added or changed.
+        
+        Returns:
+            True if the statistics changed
+        """
+        file_path = os.path.join(self.lora_dir, lora_name)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return self.remove_file(lora_name)
+        
+        entry = self.files.get(lora_name)
+        if entry is not None and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            return False
+        
+        tag_freq = LoraTriggerExtractor().extract_trigger_words(file_path)
+        tags = {tag: int(count) for tag, count in tag_freq.items()}
+        
+        self.remove_file(lora_name)
+        self.files[lora_name] = {"mtime": stat.st_mtime, "size": stat.st_size, "tags": tags}
+        if tags:
+            self.num_tagged_files += 1
+        for tag in tags:
+            self.document_frequency[tag] = self.document_frequency.get(tag, 0) + 1
+        self._ranked_tags.clear()
+        return True
+    
+    def remove_file(self, lora_name):
+        """
+        Remove a single LoRA file from the statistics.
+        
+        Returns:
+            True if the statistics changed
+        """
+        entry = self.files.pop(lora_name, None)
+        if entry is None:
+            return False
+        
+        if entry["tags"]:
+            self.num_tagged_files -= 1
+        for tag in entry["tags"]:
+            count = self.document_frequency.get(tag, 0) - 1
+            if count > 0:
+                self.document_frequency[tag] = count
+            else:
+                self.document_frequency.pop(tag, None)
+        self._ranked_tags.clear()
+        return True
+    
+    def list_lora_names(self):
+        """
+        List the LoRA files of the library directory.
+        
+        Returns:
+            Set of file names, or None if the directory could not be listed
+        """
+        try:
+            return {f for f in os.listdir(self.lora_dir) if f.endswith('.safetensors')}
+        except OSError as e:
+            print(f"Error listing LoRA directory {self.lora_dir}: {str(e)}")
+            return None
+    
+    def sync(self):
+        """
+        Add and remove files so the statistics match the directory listing, and persist
+        them if anything changed. Files already in the statistics are not checked.
+        """
+        lora_names = self.list_lora_names()
+        if lora_names is None:
+            return
+        
+        changed = False
+        for lora_name in set(self.files) - lora_names:
+            changed = self.remove_file(lora_name) or changed
+        for lora_name in sorted(lora_names - set(self.files)):
+            changed = self.update_file(lora_name) or changed
+        
+        if changed:
+            self.save()
+    
+    def refresh(self):
+        """
+        Bring the statistics up to date with the library directory and persist them if
+        anything changed. Unchanged files are detected by modification time and size
+        and are not re-read.
+        """
+        lora_names = self.list_lora_names()
+        if lora_names is None:
+            return
+        
+        changed = False
+        for lora_name in set(self.files) - lora_names:
+            changed = self.remove_file(lora_name) or changed
+        for lora_name in sorted(lora_names):
+            changed = self.update_file(lora_name) or changed
+        
+        if changed:
+            self.save()
+    
+    def idf(self, tag):
+        """
+        Inverse document frequency of a tag across the tagged files of the library.
+        Tags found in every tagged file (e.g. "1girl", "solo") get 0.
+        """
+        return math.log(max(1, self.num_tagged_files) / max(1, self.document_frequency.get(tag, 0)))
+    
+    def get_ranked_tags(self, lora_name):
+        """
+        Get the tags of a LoRA file sorted by TF-IDF score (highest first).
+        
+        Returns:
+            List of tags, or empty list if the file has no tag frequency data
+        """
+        ranked_tags = self._ranked_tags.get(lora_name)
+        if ranked_tags is None:
+            entry = self.files.get(lora_name)
+            if entry is None:
+                return []
+            
+            # Tags are stored by frequency, so the stable sort breaks ties by frequency
+            tags = entry["tags"]
+            ranked_tags = sorted(tags, key=lambda tag: tags[tag] * self.idf(tag), reverse=True)
+            self._ranked_tags[lora_name] = ranked_tags
+        
+        return ranked_tags
+
+
+# Statistics of the LoRA library, created on first use
+_tag_statistics = None
+
+def get_lora_tag_statistics():
+    """
+    Get the tag statistics of the LoRA library. The first call brings every file up to
+    date, later calls only pick up files added to or removed from the directory.
+    """
+    global _tag_statistics
+    if _tag_statistics is None:
+        _tag_statistics = LoraTagStatistics(get_lora_path())
+        _tag_statistics.refresh()
+    else:
+        _tag_statistics.sync()
+    return _tag_statistics
+
 
 class LoraAndTriggerWordsLoader:
     @classmethod
     def INPUT_TYPES(cls):
         # Get list of available LoRA models
-        lora_files = [f for f in os.listdir(lora_path) if f.endswith('.safetensors')]
+        lora_files = [f for f in os.listdir(get_lora_path()) if f.endswith('.safetensors')]
         
         return {
             "required": {
@@ -95,6 +334,9 @@ class LoraAndTriggerWordsLoader:
                 "top_percent_trigger_words": ("INT", {"default": 20, "min": 1, "max": 100, "step": 1}),
                 "lora_weight": ("FLOAT", {"default": 1.0, "min": 0.0, "max": 2.0, "step": 0.01}),
             },
+            "optional": {
+                "trigger_word_ranking": (TRIGGER_WORD_RANKINGS, {"default": FREQUENCY_RANKING}),
+            },
         }
 
     RETURN_TYPES = ("MODEL", "CLIP", "STRING")
@@ -102,9 +344,9 @@ class LoraAndTriggerWordsLoader:
     FUNCTION = "load_lora_and_extract_triggers"
     CATEGORY = "loaders"
 
-    def load_lora_and_extract_triggers(self, model, clip, select_lora, top_percent_trigger_words, lora_weight):
+    def load_lora_and_extract_triggers(self, model, clip, select_lora, top_percent_trigger_words, lora_weight, trigger_word_ranking=FREQUENCY_RANKING):
         # Full path to the selected LoRA
-        lora_file_path = os.path.join(lora_path, select_lora)
+        lora_file_path = os.path.join(get_lora_path(), select_lora)
         
         # Load the LoRA model
         # This uses ComfyUI's built-in LoRA loading functionality
@@ -113,10 +355,22 @@ class LoraAndTriggerWordsLoader:
         
         # Extract trigger words
         extractor = LoraTriggerExtractor()
-        trigger_words = extractor.get_top_percent_triggers(
-            lora_file_path, 
-            top_percent=top_percent_trigger_words
-        )
+        if trigger_word_ranking == DISTINCTIVE_RANKING:
+            # Added and removed files are synced from the listing, only the selected
+            # file is checked for changes instead of rescanning the library
+            statistics = get_lora_tag_statistics()
+            if statistics.update_file(select_lora):
+                statistics.save()
+            trigger_words = extractor.get_top_percent_distinctive_triggers(
+                select_lora,
+                statistics,
+                top_percent=top_percent_trigger_words
+            )
+        else:
+            trigger_words = extractor.get_top_percent_triggers(
+                lora_file_path, 
+                top_percent=top_percent_trigger_words
+            )
         
         # Join trigger words into a string for adding to the prompt
         trigger_words_str = ", ".join(trigger_words)
@@ -0,0 +1,274 @@
+import json
+import re
+from functools import lru_cache
+
+from .variable_node import convert_variable_value
+from .weighted_attributes_formatter_node import format_weighted_attributes
+
+# Reserved placeholders filled from the attributes and trigger sources of the spec
+ATTRIBUTES_PLACEHOLDER = "$ATTRIBUTES$"
+TRIGGERS_PLACEHOLDER = "$TRIGGERS$"
+RESERVED_PLACEHOLDERS = (ATTRIBUTES_PLACEHOLDER, TRIGGERS_PLACEHOLDER)
+
+DEFAULT_PROMPT_SPEC = """{
+    "variables": [
+        {"name": "PLANET", "value": "MARS", "type": "STRING"}
+    ],
+    "template": "$TRIGGERS$, Hello from planet $PLANET$, $ATTRIBUTES$",
+    "attributes": [
+        {"key": "Hair", "value": "Brown", "weight": 0.2}
+    ],
+    "low_weight_max": 0.35,
+    "medium_weight_max": 0.7,
+    "separator": ", ",
+    "triggers": []
+}"""
+
+
+class PromptPlan:
+    """
+    A compiled prompt assembly spec.
+
+    The template is split once into literal text and placeholder segments, and the
+    attribute and static trigger strings are formatted once, so rendering is a single
+    pass over the segments. When reserved placeholders render empty, at most one
+    separator next to them is dropped, and only where it would otherwise be left
+    dangling.
+    """
+
+    def __init__(self, segments, variables, triggers, separator_pattern):
+        # Tuple of (is_placeholder, text) pairs, placeholders store the variable name
+        self.segments = segments
+        # Dict of variable name -> string value, including the reserved placeholders
+        self.variables = variables
+        # Tuple of static trigger words from the spec
+        self.triggers = triggers
+        # Matches a separator (comma or the spec separator) with surrounding whitespace
+        self.leading_separator = re.compile(rf"^\s*(?:{separator_pattern})?\s*")
+        self.trailing_separator = re.compile(rf"\s*(?:{separator_pattern})?\s*$")
+
+    def render(self, trigger_words="", overrides=None):
+        """
+        Render the final prompt string in one pass over the compiled segments.
+
+        Args:
+            trigger_words: Comma separated trigger words (e.g. from the LoRA loader),
+                appended after the static triggers of the spec
+            overrides: Optional dict of variable name -> value replacing spec values
+
+        Returns:
+            The assembled prompt string
+        """
+        values = self.variables
+        if overrides or (trigger_words and trigger_words.strip()):
+            values = dict(values)
+        if overrides:
+            values.update((name, str(value)) for name, value in overrides.items())
+        if trigger_words and trigger_words.strip():
+            values[TRIGGERS_PLACEHOLDER] = ", ".join(self.triggers + (trigger_words.strip(),))
+
+        parts = []
+        has_output = False
+        drop_leading_separator = False
+        index = 0
+        while index < len(self.segments):
+            is_placeholder, text = self.segments[index]
+            if not is_placeholder:
+                if drop_leading_separator:
+                    text = self.leading_separator.sub("", text, count=1)
+                parts.append(text)
+                has_output = has_output or text.strip() != ""
+                drop_leading_separator = False
+                index += 1
+                continue
+
+            value = values[text]
+            if value or text not in RESERVED_PLACEHOLDERS:
+                parts.append(value)
+                has_output = has_output or value.strip() != ""
+                drop_leading_separator = False
+                index += 1
+                continue
+
+            # Skip the whole run of adjacent empty reserved placeholders, then drop at
+            # most one separator around it, never one that joins two non-empty pieces
+            previous_segment = self.segments[index - 1] if index > 0 else None
+            while index < len(self.segments):
+                is_placeholder, text = self.segments[index]
+                if not (is_placeholder and text in RESERVED_PLACEHOLDERS and not values[text]):
+                    break
+                index += 1
+            next_segment = self.segments[index] if index < len(self.segments) else None
+
+            separator_before = (
+                previous_segment is not None and not previous_segment[0]
+                and self.trailing_separator.search(parts[-1]).group(0) != ""
+            )
+            separator_after = (
+                next_segment is not None and not next_segment[0]
+                and self.leading_separator.match(next_segment[1]).group(0) != ""
+            )
+            if separator_before and (separator_after or next_segment is None):
+                parts[-1] = self.trailing_separator.sub("", parts[-1], count=1)
+            elif separator_after and not has_output:
+                drop_leading_separator = True
+
+        return "".join(parts)
+
+
+@lru_cache(maxsize=64)
+def compile_prompt_plan(spec_text, override_names=()):
+    """
+    Compile a JSON prompt assembly spec into a cached PromptPlan.
+
+    Args:
+        spec_text: JSON object with "variables", "template", "attributes",
+            "low_weight_max", "medium_weight_max", "separator" and "triggers" keys
+        override_names: Variable names that are supplied at render time, so their
+            placeholders must be kept even if the spec does not define them
+
+    Returns:
+        PromptPlan for the spec
+    """
+    try:
+        spec = json.loads(spec_text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid prompt spec JSON: {str(e)}")
+    if not isinstance(spec, dict):
+        raise ValueError("Prompt spec must be a JSON object")
+
+    for list_key in ("variables", "attributes"):
+        if not isinstance(spec.get(list_key, []), list):
+            raise ValueError(f"\"{list_key}\" must be a list")
+
+    # Convert the variables the same way the Variable node does
+    variables = {}
+    for index, variable in enumerate(spec.get("variables", []), start=1):
+        if not isinstance(variable, dict) or "value" not in variable:
+            raise ValueError(f"Variable {index} must be an object with a \"name\" and a \"value\"")
+        name = variable.get("name")
+        if not isinstance(name, str) or name.strip() == "":
+            raise ValueError(f"Variable {index} must have a non-empty string \"name\"")
+        value = variable["value"]
+        if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+            raise ValueError(f"Variable '{name}' \"value\" must be a string or a number, got {value!r}")
+        typed_value = convert_variable_value(value, variable.get("type", "STRING"))
+        variables[name] = str(typed_value)
+
+    # Format the attributes the same way the Weighted Attributes Formatter node does
+    attrs = []
+    for index, attr in enumerate(spec.get("attributes", []), start=1):
+        if not isinstance(attr, dict):
+            raise ValueError(f"Attribute {index} must be an object with a \"key\", \"value\" and \"weight\"")
+        key = attr.get("key", "")
+        if not isinstance(key, str):
+            raise ValueError(f"Attribute {index} \"key\" must be a string, got {key!r}")
+        if key.strip() == "":
+            continue
+        try:
+            weight = float(attr.get("weight", 0.0))
+        except (TypeError, ValueError):
+            raise ValueError(f"Attribute '{key}' \"weight\" must be a number, got {attr.get('weight')!r}")
+        attrs.append({"key": key, "value": attr.get("value", ""), "weight": weight})
+
+    try:
+        low_weight_max = float(spec.get("low_weight_max", 0.35))
+        medium_weight_max = float(spec.get("medium_weight_max", 0.7))
+    except (TypeError, ValueError):
+        raise ValueError("\"low_weight_max\" and \"medium_weight_max\" must be numbers")
+    separator = spec.get("separator", ", ")
+    if not isinstance(separator, str):
+        raise ValueError(f"\"separator\" must be a string, got {separator!r}")
+    attributes_str = format_weighted_attributes(attrs, low_weight_max, medium_weight_max, separator)
+
+    triggers = spec.get("triggers", [])
+    if isinstance(triggers, str):
+        triggers = [triggers]
+    if not isinstance(triggers, list) or not all(isinstance(trigger, str) for trigger in triggers):
+        raise ValueError("\"triggers\" must be a string or a list of strings")
+    triggers = tuple(trigger.strip() for trigger in triggers if trigger.strip())
+
+    # Split the template on every known placeholder, longest names first so that
+    # e.g. $PLANET_NAME$ is not consumed by $PLANET$
+    placeholders = [f"${name}$" for name in set(variables) | set(override_names)]
+    placeholders += [ATTRIBUTES_PLACEHOLDER, TRIGGERS_PLACEHOLDER]
+    pattern = re.compile("|".join(re.escape(p) for p in sorted(placeholders, key=len, reverse=True)))
+
+    template = spec.get("template", f"{TRIGGERS_PLACEHOLDER}, {ATTRIBUTES_PLACEHOLDER}")
+    if not isinstance(template, str):
+        raise ValueError(f"\"template\" must be a string, got {template!r}")
+    segments = []
+    position = 0
+    for match in pattern.finditer(template):
+        if match.start() > position:
+            segments.append((False, template[position:match.start()]))
+        placeholder = match.group(0)
+        if placeholder in (ATTRIBUTES_PLACEHOLDER, TRIGGERS_PLACEHOLDER):
+            segments.append((True, placeholder))
+        else:
+            segments.append((True, placeholder[1:-1]))
+        position = match.end()
+    if position < len(template):
+        segments.append((False, template[position:]))
+
+    variables[ATTRIBUTES_PLACEHOLDER] = attributes_str
+    variables[TRIGGERS_PLACEHOLDER] = ", ".join(triggers)
+
+    separator_pattern = ","
+    if separator.strip() not in ("", ","):
+        separator_pattern += "|" + re.escape(separator.strip())
+
+    return PromptPlan(tuple(segments), variables, triggers, separator_pattern)
+
+
+class PromptAssemblyNode:
+    """
+    A node that assembles a full prompt from variables, a template, weighted attributes
+    and trigger words in a single step, using a compiled and cached render plan.
+    """
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "prompt_spec": ("STRING", {
+                    "multiline": True,
+                    "default": DEFAULT_PROMPT_SPEC
+                })
+            },
+            "optional": {
+                "trigger_words": ("STRING", {"forceInput": True}),
+                "variable": ("VARIABLE",)  # Overrides the spec variable with the same name
+            }
+        }
+
+    RETURN_TYPES = ("STRING",)
+    RETURN_NAMES = ("prompt",)
+    FUNCTION = "assemble_prompt"
+    CATEGORY = "text"
+
+    def assemble_prompt(self, prompt_spec, trigger_words="", variable=None):
+        """
+        Render the prompt described by the spec using its cached plan.
+        """
+        overrides = None
+        override_names = ()
+        if variable is not None:
+            overrides = {variable["name"]: variable["value"]}
+            override_names = (variable["name"],)
+
+        plan = compile_prompt_plan(prompt_spec, override_names)
+        result = plan.render(trigger_words, overrides)
+
+        print(f"Assembled prompt: {result}")
+
+        return (result,)
+
+# Node registration
+NODE_CLASS_MAPPINGS = {
+    "PromptAssembly": PromptAssemblyNode
+}
+
+NODE_DISPLAY_NAME_MAPPINGS = {
+    "LLMCoderNodes::PromptAssembly": "Prompt Assembly"
+}
@@ -1,3 +1,25 @@
+def convert_variable_value(variable_value, variable_type="STRING"):
+    """
+    Convert a raw variable value to the given variable type, falling back to the string.
+    """
+    if variable_type == "INTEGER":
+        try:
+            typed_value = int(variable_value)
+        except ValueError:
+            print(f"Warning: Could not convert '{variable_value}' to integer, using as string")
+            typed_value = variable_value
+    elif variable_type == "FLOAT":
+        try:
+            typed_value = float(variable_value)
+        except ValueError:
+            print(f"Warning: Could not convert '{variable_value}' to float, using as string")
+            typed_value = variable_value
+    else:
+        typed_value = variable_value
+    
+    return typed_value
+
+
 class VariableNode:
     """
     A node that defines a named variable with a value.
@@ -24,21 +46,7 @@ class VariableNode:
         """
         Create a variable with name and value.
         """
-        # Convert the value to the specified type
-        if variable_type == "INTEGER":
-            try:
-                typed_value = int(variable_value)
-            except ValueError:
-                print(f"Warning: Could not convert '{variable_value}' to integer, using as string")
-                typed_value = variable_value
-        elif variable_type == "FLOAT":
-            try:
-                typed_value = float(variable_value)
-            except ValueError:
-                print(f"Warning: Could not convert '{variable_value}' to float, using as string")
-                typed_value = variable_value
-        else:
-            typed_value = variable_value
+        typed_value = convert_variable_value(variable_value, variable_type)
         
         # Create a variable object
         variable = {
@@ -1,3 +1,39 @@
+def format_weighted_attributes(attrs, low_weight_max=0.35, medium_weight_max=0.7, separator=", "):
+    """
+    Format a list of {"key", "value", "weight"} attributes into a single weighted string.
+    """
+    # Validate weight thresholds
+    if low_weight_max >= medium_weight_max:
+        raise ValueError(f"Low weight max ({low_weight_max}) must be less than medium weight max ({medium_weight_max})")
+    if medium_weight_max >= 1.0:
+        raise ValueError(f"Medium weight max ({medium_weight_max}) must be less than 1.0")
+    
+    # Format each attribute based on its weight
+    formatted_items = []
+    
+    for attr in attrs:
+        key = attr["key"]
+        value = attr["value"]
+        weight = attr["weight"]
+        
+        # Determine format based on weight
+        if weight < low_weight_max:
+            format_str = "({key}={value}:{weight})"
+        elif weight < medium_weight_max:
+            format_str = "(({key}={value}:{weight}))"
+        else:
+            format_str = "((({key}={value}:{weight})))"
+        
+        # Format the attribute
+        formatted_item = format_str.format(key=key, value=value, weight=weight)
+        formatted_items.append(formatted_item)
+    
+    # Join all formatted items with the specified separator
+    result = separator.join(formatted_items)
+    
+    return result
+
+
 class WeightedAttributesFormatterNode:
     """
     A node that creates weighted attributes and formats them into a single string.
@@ -53,12 +89,6 @@ class WeightedAttributesFormatterNode:
         medium_weight_max = kwargs.get("medium_weight_max", 0.7)
         separator = kwargs.get("separator", ", ")
         
-        # Validate weight thresholds
-        if low_weight_max >= medium_weight_max:
-            raise ValueError(f"Low weight max ({low_weight_max}) must be less than medium weight max ({medium_weight_max})")
-        if medium_weight_max >= 1.0:
-            raise ValueError(f"Medium weight max ({medium_weight_max}) must be less than 1.0")
-        
         # Extract attribute data
         attrs = []
         
@@ -75,28 +105,8 @@ class WeightedAttributesFormatterNode:
                     "weight": weight
                 })
         
-        # Format each attribute based on its weight
-        formatted_items = []
-        
-        for attr in attrs:
-            key = attr["key"]
-            value = attr["value"]
-            weight = attr["weight"]
-            
-            # Determine format based on weight
-            if weight < low_weight_max:
-                format_str = "({key}={value}:{weight})"
-            elif weight < medium_weight_max:
-                format_str = "(({key}={value}:{weight}))"
-            else:
-                format_str = "((({key}={value}:{weight})))"
-            
-            # Format the attribute
-            formatted_item = format_str.format(key=key, value=value, weight=weight)
-            formatted_items.append(formatted_item)
-        
-        # Join all formatted items with the specified separator
-        result = separator.join(formatted_items)
+        # Format the attributes and join them with the specified separator
+        result = format_weighted_attributes(attrs, low_weight_max, medium_weight_max, separator)
         
         print(f"Processed {len(attrs)} attributes")
         print(f"Formatted string: {result}")
@@ -0,0 +1,72 @@
+import json
+import os
+import struct
+
+import pytest
+
+from nodes.lora_trigger_loader import LoraTagStatistics
+
+
+def write_lora(lora_dir, name, tags=None):
+    metadata = {} if tags is None else {"ss_tag_frequency": json.dumps(tags)}
+    header = json.dumps({"__metadata__": metadata}).encode("utf-8")
+    with open(os.path.join(lora_dir, name), "wb") as f:
+        f.write(struct.pack("<Q", len(header)) + header)
+
+
+@pytest.fixture
+def lora_dir(tmp_path):
+    lora_dir = tmp_path / "loras"
+    lora_dir.mkdir()
+    write_lora(lora_dir, "a.safetensors", {"1girl": 50, "solo": 40, "elf": 10})
+    write_lora(lora_dir, "b.safetensors", {"1girl": 50, "solo": 40, "dwarf": 5})
+    write_lora(lora_dir, "c.safetensors", {"1girl": 30, "robot": 8})
+    return lora_dir
+
+
+def make_statistics(lora_dir, tmp_path):
+    statistics = LoraTagStatistics(str(lora_dir), str(tmp_path / "stats.json"))
+    statistics.refresh()
+    return statistics
+
+
+def test_tags_in_every_file_rank_last(lora_dir, tmp_path):
+    statistics = make_statistics(lora_dir, tmp_path)
+    assert statistics.idf("1girl") == 0
+    assert statistics.get_ranked_tags("a.safetensors") == ["solo", "elf", "1girl"]
+
+
+def test_untagged_files_do_not_count_as_documents(lora_dir, tmp_path):
+    write_lora(lora_dir, "d.safetensors")
+    write_lora(lora_dir, "e.safetensors")
+    statistics = make_statistics(lora_dir, tmp_path)
+    assert len(statistics.files) == 5
+    assert statistics.num_tagged_files == 3
+    assert statistics.idf("1girl") == 0
+
+
+def test_statistics_are_persisted_per_normalised_directory(lora_dir, tmp_path):
+    make_statistics(lora_dir, tmp_path)
+    statistics = LoraTagStatistics(str(lora_dir) + os.sep, str(tmp_path / "stats.json"))
+    assert len(statistics.files) == 3
+    assert statistics.num_tagged_files == 3
+    assert statistics.document_frequency["1girl"] == 3
+
+
+def test_sync_picks_up_added_and_removed_files(lora_dir, tmp_path):
+    statistics = make_statistics(lora_dir, tmp_path)
+    os.remove(lora_dir / "c.safetensors")
+    write_lora(lora_dir, "d.safetensors", {"1girl": 5, "cat": 2})
+    statistics.sync()
+    assert sorted(statistics.files) == ["a.safetensors", "b.safetensors", "d.safetensors"]
+    assert "robot" not in statistics.document_frequency
+    assert statistics.document_frequency["cat"] == 1
+    assert statistics.idf("1girl") == 0
+
+
+def test_update_file_reads_changed_file(lora_dir, tmp_path):
+    statistics = make_statistics(lora_dir, tmp_path)
+    write_lora(lora_dir, "c.safetensors", {"1girl": 30, "robot": 8, "android": 3})
+    assert statistics.update_file("c.safetensors")
+    assert statistics.document_frequency["android"] == 1
+    assert not statistics.update_file("c.safetensors")
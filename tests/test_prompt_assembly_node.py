@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from nodes.prompt_assembly_node import DEFAULT_PROMPT_SPEC, PromptAssemblyNode, compile_prompt_plan
+
+
+def render(template, trigger_words="", attributes=None, separator=", "):
+    spec = {
+        "variables": [{"name": "P", "value": "MARS"}, {"name": "Q", "value": "X"}],
+        "template": template,
+        "attributes": attributes or [],
+        "separator": separator,
+    }
+    return compile_prompt_plan(json.dumps(spec)).render(trigger_words)
+
+
+def test_default_spec_has_no_leading_separator():
+    (result,) = PromptAssemblyNode().assemble_prompt(DEFAULT_PROMPT_SPEC)
+    assert result == "Hello from planet MARS, (Hair=Brown:0.2)"
+
+
+def test_default_spec_with_trigger_words():
+    (result,) = PromptAssemblyNode().assemble_prompt(DEFAULT_PROMPT_SPEC, "a, b")
+    assert result == "a, b, Hello from planet MARS, (Hair=Brown:0.2)"
+
+
+@pytest.mark.parametrize("template, expected", [
+    ("$TRIGGERS$, $P$", "MARS"),
+    ("$P$, $ATTRIBUTES$", "MARS"),
+    ("$P$, $TRIGGERS$, $Q$", "MARS, X"),
+    ("$TRIGGERS$, $ATTRIBUTES$", ""),
+    ("$P$, $TRIGGERS$, $ATTRIBUTES$, $Q$", "MARS, X"),
+    # Separators joining two non-empty pieces are kept
+    ("$TRIGGERS$$P$, x", "MARS, x"),
+    ("$P$$TRIGGERS$, $Q$", "MARS, X"),
+    ("$P$, $TRIGGERS$$ATTRIBUTES$, $Q$", "MARS, X"),
+    ("$P$, $TRIGGERS$x", "MARS, x"),
+])
+def test_separators_around_empty_placeholders(template, expected):
+    assert render(template) == expected
+
+
+def test_spec_separator_is_dropped():
+    assert render("$TRIGGERS$ | $P$", separator=" | ") == "MARS"
+
+
+def test_non_empty_placeholders_keep_separators():
+    attributes = [{"key": "Hair", "value": "Brown", "weight": 0.2}]
+    assert render("$P$, $TRIGGERS$, $ATTRIBUTES$", "t", attributes) == "MARS, t, (Hair=Brown:0.2)"
+
+
+def test_variable_override():
+    (result,) = PromptAssemblyNode().assemble_prompt(DEFAULT_PROMPT_SPEC, variable={"name": "PLANET", "value": 3})
+    assert result == "Hello from planet 3, (Hair=Brown:0.2)"
+
+
+@pytest.mark.parametrize("spec", [
+    "{bad",
+    "[]",
+    '{"variables": [{"name": "A"}]}',
+    '{"variables": [{"value": 1}]}',
+    '{"variables": [{"name": "A", "value": null, "type": "INTEGER"}]}',
+    '{"variables": [{"name": "A", "value": [1], "type": "FLOAT"}]}',
+    '{"variables": 5}',
+    '{"attributes": 5}',
+    '{"attributes": [{"key": 3}]}',
+    '{"attributes": [{"key": "a", "weight": "x"}]}',
+    '{"triggers": 5}',
+    '{"triggers": [1]}',
+    '{"template": 123}',
+    '{"separator": 1}',
+])
+def test_malformed_spec_raises_value_error(spec):
+    with pytest.raises(ValueError):
+        compile_prompt_plan(spec)